@@ -19,13 +19,27 @@ Usage:
 Author: DevOps Assessment
 """
 
+import os
+import re
 import sys
 import time
+import signal
+import asyncio
+import logging
 import argparse
+import functools
 import subprocess
 import platform
 from datetime import datetime
 
+try:
+    import psutil
+except ImportError:
+    # psutil gathers the same metrics through C extensions with no
+    # subprocesses and identical behaviour across platforms; the /proc and
+    # shell implementations below remain as a fallback when it is missing.
+    psutil = None
+
 # Default thresholds (percentage)
 DEFAULT_THRESHOLDS = {
     'cpu': 80,
@@ -33,8 +47,49 @@ DEFAULT_THRESHOLDS = {
     'disk': 80
 }
 
+# Report formatting constants, built once instead of per call.
+SEP = '=' * 70
+GREEN = '\033[92m'
+RED = '\033[91m'
+RESET = '\033[0m'
+PROC_HEADER = f"  {'PID':<8} {'CPU%':<6} {'MEM%':<6} {'USER':<10} {'COMMAND'}"
+PROC_DIVIDER = '  ' + '-' * 60
+
+# Matches the ANSI color codes used in reports, for log output.
+ANSI_RE = re.compile(r'\x1b\[\d+m')
+
+# Cached (timestamp, value) pairs keyed by getter name, see ttl_cache.
+_METRIC_CACHE = {}
+
+def ttl_cache(seconds):
+    """
+    Cache a metric getter's result for the given number of seconds.
+
+    Collecting a metric spawns shell pipelines, and at short check
+    intervals the values barely change between back-to-back calls, so a
+    short TTL avoids the repeated subprocess cost. Call the wrapped
+    function with force=True to bypass the cache and refresh.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, force=False, **kwargs):
+            now = time.monotonic()
+            if not force:
+                cached = _METRIC_CACHE.get(func.__name__)
+                if cached is not None and now - cached[0] < seconds:
+                    return cached[1]
+            value = func(*args, **kwargs)
+            _METRIC_CACHE[func.__name__] = (now, value)
+            return value
+        return wrapper
+    return decorator
+
+@ttl_cache(seconds=1)
 def get_cpu_usage():
     """Get current CPU usage percentage."""
+    if psutil is not None:
+        return psutil.cpu_percent(interval=0.1)
+
     try:
         if platform.system() == 'Darwin':  # macOS
             # Using top command for macOS
@@ -42,10 +97,23 @@ def get_cpu_usage():
             result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
             return float(result.stdout.strip())
         else:  # Linux
-            # Using top command for Linux
-            cmd = "top -bn1 | grep 'Cpu(s)' | awk '{print $2}' | sed 's/%us,//'"
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-            return float(result.stdout.strip())
+            # Sample /proc/stat twice and compute busy time from the delta;
+            # two file reads instead of a top|grep|awk|sed pipeline.
+            def read_cpu_times():
+                with open('/proc/stat', 'r') as f:
+                    fields = [float(v) for v in f.readline().split()[1:]]
+                idle = fields[3] + (fields[4] if len(fields) > 4 else 0.0)
+                return idle, sum(fields)
+
+            idle_1, total_1 = read_cpu_times()
+            time.sleep(0.1)
+            idle_2, total_2 = read_cpu_times()
+
+            total_delta = total_2 - total_1
+            if total_delta <= 0:
+                return 0.0
+            usage = (1 - (idle_2 - idle_1) / total_delta) * 100
+            return usage
     except:
         # Fallback: parse /proc/stat on Linux
         try:
@@ -55,8 +123,12 @@ def get_cpu_usage():
         except:
             return 0.0
 
+@ttl_cache(seconds=2)
 def get_memory_usage():
     """Get current memory usage percentage."""
+    if psutil is not None:
+        return psutil.virtual_memory().percent
+
     try:
         if platform.system() == 'Darwin':  # macOS
             # Get total memory
@@ -71,61 +143,131 @@ def get_memory_usage():
             free_memory = free_pages * page_size
             used_memory = total - free_memory
             usage = (used_memory / total) * 100
-            return round(usage, 2)
+            return usage
         else:  # Linux
+            # Parse /proc/meminfo into a dict in one pass instead of
+            # scanning all lines once per field.
+            info = {}
             with open('/proc/meminfo', 'r') as f:
-                lines = f.readlines()
-                mem_total = int([l for l in lines if 'MemTotal' in l][0].split()[1])
-                mem_available = int([l for l in lines if 'MemAvailable' in l][0].split()[1])
-                usage = ((mem_total - mem_available) / mem_total) * 100
-                return round(usage, 2)
+                for line in f:
+                    key, _, value = line.partition(':')
+                    info[key] = int(value.split()[0])
+            usage = ((info['MemTotal'] - info['MemAvailable'])
+                     / info['MemTotal']) * 100
+            return usage
     except:
         return 0.0
 
+# Disk fills slowly, so it can be cached far longer than CPU/memory.
+@ttl_cache(seconds=60)
 def get_disk_usage():
     """Get disk usage percentage for root partition."""
+    # os.statvfs is a single syscall and behaves identically on Linux and
+    # macOS, so no df pipeline or psutil branch is needed here.
     try:
-        cmd = "df -h / | tail -1 | awk '{print $5}' | sed 's/%//'"
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-        return float(result.stdout.strip())
-    except:
+        stats = os.statvfs('/')
+        usage = (1 - stats.f_bavail / stats.f_blocks) * 100
+        return usage
+    except OSError:
         return 0.0
 
 def get_top_processes(count=5):
     """Get top CPU-consuming processes."""
+    if psutil is not None:
+        return collect_metrics(proc_count=count)['top_processes']
+
     try:
+        # Call ps directly and slice in Python instead of piping through
+        # sort|head|tail under a shell: one process instead of five.
         if platform.system() == 'Darwin':  # macOS
-            cmd = f"ps aux | sort -rk 3 | head -{count+1} | tail -{count}"
+            cmd = ['ps', '-axo', 'user,pid,%cpu,%mem,command', '-r']
         else:  # Linux
-            cmd = f"ps aux --sort=-%cpu | head -{count+1} | tail -{count}"
+            cmd = ['ps', 'axo', 'user,pid,%cpu,%mem,command',
+                   '--sort=-%cpu', '--no-headers']
 
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-        lines = result.stdout.strip().split('\n')
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        lines = result.stdout.splitlines()
+        if platform.system() == 'Darwin':
+            lines = lines[1:]  # BSD ps has no --no-headers
 
         processes = []
-        for line in lines:
-            parts = line.split()
-            if len(parts) >= 11:
+        for line in lines[:count]:
+            parts = line.split(None, 4)
+            if len(parts) == 5:
                 processes.append({
                     'user': parts[0],
                     'pid': parts[1],
                     'cpu': parts[2],
                     'mem': parts[3],
-                    'command': ' '.join(parts[10:])[:50]
+                    'command': parts[4][:50]
                 })
         return processes
     except:
         return []
 
+def collect_metrics(proc_count=5):
+    """
+    Collect all system metrics in one sampling pass.
+
+    With psutil, a single process_iter walk primes the per-process CPU
+    counters and the system-wide cpu_percent shares the same measurement
+    interval, so one pass over the process table serves both the summary
+    metrics and the top-N list instead of each getter walking /proc on
+    its own. Without psutil this falls back to the individual getters.
+
+    Returns:
+        dict: cpu_usage, memory_usage, disk_usage, top_processes
+    """
+    if psutil is None:
+        return {
+            'cpu_usage': get_cpu_usage(),
+            'memory_usage': get_memory_usage(),
+            'disk_usage': get_disk_usage(),
+            'top_processes': get_top_processes(proc_count)
+        }
+
+    # The first cpu_percent calls only prime the counters; the second,
+    # after a short wait, yields real interval measurements.
+    procs = list(psutil.process_iter(['pid', 'username', 'name']))
+    psutil.cpu_percent(interval=None)
+    for proc in procs:
+        try:
+            proc.cpu_percent(interval=None)
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            pass
+    time.sleep(0.1)
+
+    snapshot = []
+    for proc in procs:
+        try:
+            snapshot.append({
+                'user': proc.info['username'] or '?',
+                'pid': str(proc.info['pid']),
+                'cpu': f"{proc.cpu_percent(interval=None):.1f}",
+                'mem': f"{proc.memory_percent():.1f}",
+                'command': (' '.join(proc.cmdline()) or proc.info['name'])[:50]
+            })
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+    snapshot.sort(key=lambda proc: float(proc['cpu']), reverse=True)
+
+    return {
+        'cpu_usage': psutil.cpu_percent(interval=None),
+        'memory_usage': psutil.virtual_memory().percent,
+        'disk_usage': get_disk_usage(),
+        'top_processes': snapshot[:proc_count]
+    }
+
 def check_system_health(thresholds):
     """Check system health against thresholds."""
     timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
 
-    # Get metrics
-    cpu_usage = get_cpu_usage()
-    memory_usage = get_memory_usage()
-    disk_usage = get_disk_usage()
-    top_processes = get_top_processes(5)
+    # Get metrics in a single sampling pass
+    metrics = collect_metrics(proc_count=5)
+    cpu_usage = metrics['cpu_usage']
+    memory_usage = metrics['memory_usage']
+    disk_usage = metrics['disk_usage']
+    top_processes = metrics['top_processes']
 
     # Check thresholds
     alerts = []
@@ -153,10 +295,10 @@ def format_report(health_data):
     report = []
 
     # Header
-    report.append("=" * 70)
+    report.append(SEP)
     report.append("SYSTEM HEALTH MONITORING REPORT")
     report.append(f"Timestamp: {health_data['timestamp']}")
-    report.append("=" * 70)
+    report.append(SEP)
     report.append("")
 
     # Metrics
@@ -169,66 +311,104 @@ def format_report(health_data):
     # Top Processes
     if health_data['top_processes']:
         report.append("TOP CPU-CONSUMING PROCESSES:")
-        report.append(f"  {'PID':<8} {'CPU%':<6} {'MEM%':<6} {'USER':<10} {'COMMAND'}")
-        report.append("  " + "-" * 60)
+        report.append(PROC_HEADER)
+        report.append(PROC_DIVIDER)
         for proc in health_data['top_processes']:
             report.append(f"  {proc['pid']:<8} {proc['cpu']:<6} {proc['mem']:<6} {proc['user']:<10} {proc['command']}")
         report.append("")
 
     # Alerts
     if health_data['alerts']:
-        report.append("\033[91m" + "⚠ ALERTS:" + "\033[0m")
+        report.append(f"{RED}⚠ ALERTS:{RESET}")
         for alert in health_data['alerts']:
-            report.append(f"  \033[91m✗ {alert}\033[0m")
+            report.append(f"  {RED}✗ {alert}{RESET}")
     else:
-        report.append("\033[92m" + "✓ No alerts - All metrics within thresholds" + "\033[0m")
+        report.append(f"{GREEN}✓ No alerts - All metrics within thresholds{RESET}")
 
-    report.append("=" * 70)
+    report.append(SEP)
     report.append("")
 
     return '\n'.join(report)
 
-def log_to_file(report, log_file):
-    """Append report to log file."""
-    try:
-        with open(log_file, 'a') as f:
-            # Remove color codes for log file
-            clean_report = report.replace('\033[91m', '').replace('\033[92m', '').replace('\033[0m', '')
-            f.write(clean_report + '\n')
-        print(f"Report logged to: {log_file}")
-    except Exception as e:
-        print(f"Error writing to log file: {e}")
-
-def continuous_monitor(interval, thresholds, log_file=None):
+def get_file_logger(log_file):
+    """
+    Return a logger appending to log_file, or None if it can't be opened.
+
+    The FileHandler keeps the file open between reports, avoiding an
+    open/write/close cycle on every monitoring tick.
+    """
+    logger = logging.getLogger('system_health')
+    if not logger.handlers:
+        try:
+            handler = logging.FileHandler(log_file)
+        except OSError as e:
+            print(f"Error opening log file: {e}")
+            return None
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+    return logger
+
+def log_to_file(report, logger):
+    """Append report to the log, with color codes stripped."""
+    logger.info(ANSI_RE.sub('', report))
+
+async def continuous_monitor(interval, thresholds, log_file=None):
     """Continuously monitor system health at specified intervals."""
     print(f"Starting continuous system health monitoring")
     print(f"Check interval: {interval} seconds")
     print(f"Thresholds: CPU={thresholds['cpu']}%, Memory={thresholds['memory']}%, Disk={thresholds['disk']}%")
-    if log_file:
+    logger = get_file_logger(log_file) if log_file else None
+    if logger:
         print(f"Logging to: {log_file}")
     print("Press Ctrl+C to stop\n")
 
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
     try:
-        while True:
-            health_data = check_system_health(thresholds)
-            report = format_report(health_data)
-            print(report)
+        loop.add_signal_handler(signal.SIGINT, stop.set)
+        loop.add_signal_handler(signal.SIGTERM, stop.set)
+    except NotImplementedError:
+        # add_signal_handler is unavailable on Windows; Ctrl+C then raises
+        # KeyboardInterrupt which is handled in main().
+        pass
+
+    while not stop.is_set():
+        # Metric collection shells out and blocks, so run it off the event
+        # loop to keep the loop responsive to shutdown signals.
+        health_data = await asyncio.to_thread(check_system_health, thresholds)
+        report = format_report(health_data)
+        print(report)
+
+        if logger:
+            log_to_file(report, logger)
 
-            if log_file:
-                log_to_file(report, log_file)
+        # Sleep until the next interval, waking immediately on shutdown.
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=interval)
+        except asyncio.TimeoutError:
+            pass
 
-            time.sleep(interval)
-    except KeyboardInterrupt:
-        print("\n\nMonitoring stopped by user.")
+    print("\n\nMonitoring stopped by user.")
 
 def parse_thresholds(threshold_str):
-    """Parse threshold string like 'cpu=90,memory=85,disk=80'."""
+    """
+    Parse threshold string like 'cpu=90,memory=85,disk=80'.
+
+    Malformed input (missing '=', non-numeric value) falls back to the
+    defaults with a warning instead of crashing the monitor at startup.
+    """
     thresholds = DEFAULT_THRESHOLDS.copy()
 
     if threshold_str:
-        for pair in threshold_str.split(','):
-            key, value = pair.split('=')
-            thresholds[key.strip()] = int(value.strip())
+        try:
+            for pair in threshold_str.split(','):
+                key, value = pair.split('=', 1)
+                thresholds[key.strip()] = int(value)
+        except ValueError:
+            print(f"Warning: invalid thresholds '{threshold_str}', using defaults")
+            return DEFAULT_THRESHOLDS.copy()
 
     return thresholds
 
@@ -263,7 +443,10 @@ Default thresholds: CPU=80%%, Memory=80%%, Disk=80%%
 
     if args.continuous:
         # Continuous monitoring mode
-        continuous_monitor(args.interval, thresholds, args.log)
+        try:
+            asyncio.run(continuous_monitor(args.interval, thresholds, args.log))
+        except KeyboardInterrupt:
+            print("\n\nMonitoring stopped by user.")
     else:
         # One-time check
         health_data = check_system_health(thresholds)
@@ -271,7 +454,10 @@ Default thresholds: CPU=80%%, Memory=80%%, Disk=80%%
         print(report)
 
         if args.log:
-            log_to_file(report, args.log)
+            logger = get_file_logger(args.log)
+            if logger:
+                log_to_file(report, logger)
+                print(f"Report logged to: {args.log}")
 
 if __name__ == '__main__':
     main()